@@ -0,0 +1,37 @@
+import os
+import sys
+
+# Environment variable that overrides where the inventory spreadsheets live
+DATA_DIR_ENV_VAR = 'INVENTORY_DATA_DIR'
+
+INVENTORY_FILENAME = 'inventory.xlsx'
+HISTORY_FILENAME = 'inventory_history.xlsx'
+
+
+def get_application_path():
+    # Determine if running as script or compiled exe
+    if getattr(sys, 'frozen', False):
+        # If it's an exe, find the directory the exe is in
+        return os.path.dirname(sys.executable)
+    # If it's a script, find the directory the script is in
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def get_data_dir(data_dir=None):
+    """
+    Returns the directory holding the inventory files.
+
+    An explicit data_dir wins, then the INVENTORY_DATA_DIR environment
+    variable, then the directory the application runs from.
+    """
+    if data_dir is None:
+        data_dir = os.environ.get(DATA_DIR_ENV_VAR) or get_application_path()
+    return os.path.abspath(os.path.expanduser(data_dir))
+
+
+def get_inventory_file(data_dir=None):
+    return os.path.join(get_data_dir(data_dir), INVENTORY_FILENAME)
+
+
+def get_history_file(data_dir=None):
+    return os.path.join(get_data_dir(data_dir), HISTORY_FILENAME)
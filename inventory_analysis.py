@@ -1,15 +1,133 @@
+import logging
+import os
+import tempfile
 import pandas as pd
+from data_config import get_data_dir, get_inventory_file, get_history_file
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - the cache is optional
+    pa = None
+    feather = None
+
+# Columns of the history file the analytics work with
+SALES_COLUMNS = ["Item Name", "Quantity Changed", "Cost Price", "Sales Price", "Change Type", "Timestamp"]
+
+# Schema metadata keys recording which version of the spreadsheet a cache was built from
+_SOURCE_MTIME_KEY = b'source_mtime_ns'
+_SOURCE_SIZE_KEY = b'source_size'
+
+
+def _cache_path(source_path):
+    # Keep the columnar cache next to its spreadsheet, e.g. .inventory_history.feather
+    directory, filename = os.path.split(source_path)
+    return os.path.join(directory, '.' + os.path.splitext(filename)[0] + '.feather')
+
+
+def _source_signature(source_stat):
+    return {_SOURCE_MTIME_KEY: str(source_stat.st_mtime_ns).encode(),
+            _SOURCE_SIZE_KEY: str(source_stat.st_size).encode()}
+
+
+def _select_columns(df, columns):
+    if columns is None:
+        return df
+    return df[[column for column in columns if column in df.columns]]
+
+
+def _read_cache(cache_path, source_stat, columns):
+    # Returns the cached data, or None if the cache was built from another version of the source
+    with pa.memory_map(cache_path) as source:
+        reader = pa.ipc.open_file(source)
+        metadata = reader.schema.metadata or {}
+        signature = _source_signature(source_stat)
+        if any(metadata.get(key) != value for key, value in signature.items()):
+            return None
+        table = reader.read_all()
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        # Only the selected columns are copied out of the mapped file
+        return table.to_pandas()
+
+
+def _write_cache(df, cache_path, source_stat):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update(_source_signature(source_stat))
+    table = table.replace_schema_metadata(metadata)
+
+    # Write to a temporary file and move it into place so readers never see a partial cache
+    directory, filename = os.path.split(cache_path)
+    fd, temp_path = tempfile.mkstemp(prefix=filename + '.', suffix='.tmp', dir=directory)
+    os.close(fd)
+    try:
+        feather.write_feather(table, temp_path)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def read_cached_excel(source_path, columns=None):
+    """
+    Reads an Excel file through a memory-mapped Feather cache.
+
+    The cache records the spreadsheet's modification time and size and is
+    rebuilt whenever either differs, so repeat loads of large history files
+    skip the slow Excel parser. If columns is given, only those columns are
+    copied out of the cache. Falls back to reading the spreadsheet directly
+    if pyarrow is not installed or the cache cannot be written.
+    """
+    if feather is None:
+        return _select_columns(pd.read_excel(source_path), columns)
+
+    source_stat = os.stat(source_path)
+    cache_path = _cache_path(source_path)
+    if os.path.exists(cache_path):
+        try:
+            df = _read_cache(cache_path, source_stat, columns)
+            if df is not None:
+                return df
+        except (OSError, pa.lib.ArrowException) as e:
+            logging.warning(f"Ignoring unreadable analytics cache {cache_path}: {str(e)}")
+
+    df = pd.read_excel(source_path)
+    try:
+        _write_cache(df, cache_path, source_stat)
+    except (OSError, pa.lib.ArrowException) as e:
+        logging.warning(f"Failed to write analytics cache {cache_path}, reading {source_path} uncached: {str(e)}")
+    return _select_columns(df, columns)
 
-class InventoryAnalytics:
 
-    def __init__(self):
-        # File paths
-        sales_data_path = '/Users/john/PycharmProjects/revised_inventory_manager/inventory_history.xlsx'
-        inventory_data_path = '/Users/john/PycharmProjects/revised_inventory_manager/inventory.xlsx'
+class InventoryAnalytics:
 
-        # Read data from Excel files
-        self.sales_data = pd.read_excel(sales_data_path)
-        self.inventory_data = pd.read_excel(inventory_data_path)
+    def __init__(self, data_dir=None):
+        # File paths, shared with the inventory manager
+        self.data_dir = get_data_dir(data_dir)
+        self.sales_data_path = get_history_file(self.data_dir)
+        self.inventory_data_path = get_inventory_file(self.data_dir)
+
+        # Datasets are read on first use
+        self._sales_data = None
+        self._inventory_data = None
+
+    @property
+    def sales_data(self):
+        if self._sales_data is None:
+            self._sales_data = read_cached_excel(self.sales_data_path, columns=SALES_COLUMNS)
+        return self._sales_data
+
+    @property
+    def inventory_data(self):
+        if self._inventory_data is None:
+            self._inventory_data = read_cached_excel(self.inventory_data_path)
+        return self._inventory_data
+
+    def reload(self):
+        # Drop loaded datasets so the next access re-reads the files
+        self._sales_data = None
+        self._inventory_data = None
 
     def get_top_selling_items(self):
         # Filter sales data
@@ -5,14 +5,14 @@ import os
 import pandas as pd
 from tkinter import messagebox
 from custom_dialogs import AllInOneInputDialog
+from data_config import get_data_dir, get_inventory_file, get_history_file
 import logging
-import sys
 import numpy as np
 
 
 
 class InventoryManager:
-    def __init__(self, root):
+    def __init__(self, root, data_dir=None):
         self.root = root
         self.root.title("Inventory Manager")
         self.root.geometry("800x500")
@@ -22,17 +22,10 @@ class InventoryManager:
         self.top_frame = ttk.Frame(self.root)
         self.top_frame.pack(fill="both", expand=True)
 
-        # Determine if running as script or compiled exe
-        if getattr(sys, 'frozen', False):
-            # If it's an exe, find the directory the exe is in
-            application_path = os.path.dirname(sys.executable)
-        else:
-            # If it's a script, find the directory the script is in
-            application_path = os.path.dirname(os.path.abspath(__file__))
-
-        # Construct the full file paths
-        self.inventory_file = os.path.join(application_path, 'inventory.xlsx')
-        self.history_file = os.path.join(application_path, 'inventory_history.xlsx')
+        # Construct the full file paths from the shared data location
+        self.data_dir = get_data_dir(data_dir)
+        self.inventory_file = get_inventory_file(self.data_dir)
+        self.history_file = get_history_file(self.data_dir)
 
         logging.basicConfig(filename="inventory.log", level=logging.ERROR, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -51,6 +44,8 @@ class InventoryManager:
 
     def create_initial_files(self):
         try:
+            os.makedirs(self.data_dir, exist_ok=True)
+
             if not os.path.exists(self.inventory_file):
                 with pd.ExcelWriter(self.inventory_file, engine='openpyxl') as writer:
                     df = pd.DataFrame(columns=["Item Name", "Quantity", "Cost Price", "Sales Price", "Reorder Point"])
@@ -0,0 +1,135 @@
+import os
+
+import pandas as pd
+import pytest
+
+import data_config
+import inventory_analysis
+from inventory_analysis import InventoryAnalytics, read_cached_excel
+
+
+def write_history(path, rows):
+    df = pd.DataFrame({
+        "Item Name": [f"Item {i}" for i in range(rows)],
+        "Quantity Changed": list(range(rows)),
+        "Cost Price": [1.0] * rows,
+        "Sales Price": [2.0] * rows,
+        "Change Type": ["Decreased"] * rows,
+        "Timestamp": [pd.Timestamp("2024-01-01")] * rows,
+        "Location": ["Shop"] * rows,
+    })
+    df.to_excel(path, index=False)
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    path = tmp_path / "inventory_history.xlsx"
+    write_history(path, 3)
+    return str(path)
+
+
+@pytest.fixture
+def count_excel_reads(monkeypatch):
+    reads = []
+    read_excel = pd.read_excel
+
+    def counting_read_excel(*args, **kwargs):
+        reads.append(args[0])
+        return read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(inventory_analysis.pd, "read_excel", counting_read_excel)
+    return reads
+
+
+def test_data_dir_explicit_argument_wins(tmp_path, monkeypatch):
+    monkeypatch.setenv(data_config.DATA_DIR_ENV_VAR, str(tmp_path / "env"))
+    assert data_config.get_data_dir(str(tmp_path / "arg")) == str(tmp_path / "arg")
+
+
+def test_data_dir_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv(data_config.DATA_DIR_ENV_VAR, str(tmp_path / "env"))
+    assert data_config.get_data_dir() == str(tmp_path / "env")
+    assert data_config.get_history_file() == str(tmp_path / "env" / "inventory_history.xlsx")
+
+
+def test_data_dir_defaults_to_application_path(monkeypatch):
+    monkeypatch.delenv(data_config.DATA_DIR_ENV_VAR, raising=False)
+    assert data_config.get_data_dir() == os.path.dirname(os.path.abspath(data_config.__file__))
+
+
+def test_constructor_does_no_io(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("data read in constructor")
+
+    monkeypatch.setattr(inventory_analysis, "read_cached_excel", fail)
+    analytics = InventoryAnalytics(str(tmp_path / "missing"))
+    assert analytics.sales_data_path == str(tmp_path / "missing" / "inventory_history.xlsx")
+    assert not (tmp_path / "missing").exists()
+
+
+def test_datasets_load_on_first_use(history_file, tmp_path):
+    analytics = InventoryAnalytics(str(tmp_path))
+    assert list(analytics.sales_data.columns) == inventory_analysis.SALES_COLUMNS
+    assert analytics.sales_data is analytics.sales_data
+
+
+def test_cache_reused_when_source_unchanged(history_file, count_excel_reads):
+    first = read_cached_excel(history_file)
+    second = read_cached_excel(history_file)
+    assert len(count_excel_reads) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_cache_rebuilt_after_rewrite(history_file, count_excel_reads):
+    read_cached_excel(history_file)
+    write_history(history_file, 5)
+    assert len(read_cached_excel(history_file)) == 5
+    assert len(count_excel_reads) == 2
+
+
+def test_cache_rebuilt_after_rewrite_with_same_mtime(history_file, count_excel_reads):
+    mtime_ns = os.stat(history_file).st_mtime_ns
+    read_cached_excel(history_file)
+    write_history(history_file, 5)
+    os.utime(history_file, ns=(mtime_ns, mtime_ns))
+    assert len(read_cached_excel(history_file)) == 5
+    assert len(count_excel_reads) == 2
+
+
+def test_cache_rebuilt_after_older_source_restored(history_file, count_excel_reads):
+    read_cached_excel(history_file)
+    write_history(history_file, 5)
+    os.utime(history_file, ns=(0, 0))
+    assert len(read_cached_excel(history_file)) == 5
+    assert len(count_excel_reads) == 2
+
+
+def test_cache_write_leaves_no_temporary_files(history_file, tmp_path):
+    read_cached_excel(history_file)
+    assert sorted(os.listdir(tmp_path)) == [".inventory_history.feather", "inventory_history.xlsx"]
+
+
+def test_cache_selects_columns(history_file):
+    read_cached_excel(history_file)
+    df = read_cached_excel(history_file, columns=["Item Name", "Quantity Changed", "Not There"])
+    assert list(df.columns) == ["Item Name", "Quantity Changed"]
+
+
+def test_unwritable_cache_is_logged(history_file, monkeypatch, caplog):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(inventory_analysis.feather, "write_feather", fail)
+    df = read_cached_excel(history_file)
+    assert len(df) == 3
+    assert "disk full" in caplog.text
+    assert os.listdir(os.path.dirname(history_file)) == ["inventory_history.xlsx"]
+
+
+def test_falls_back_without_pyarrow(history_file, tmp_path, monkeypatch, count_excel_reads):
+    monkeypatch.setattr(inventory_analysis, "feather", None)
+    df = read_cached_excel(history_file, columns=inventory_analysis.SALES_COLUMNS)
+    read_cached_excel(history_file)
+    assert list(df.columns) == inventory_analysis.SALES_COLUMNS
+    assert len(count_excel_reads) == 2
+    assert not (tmp_path / ".inventory_history.feather").exists()